@@ -1,13 +1,75 @@
-from typing import Optional, Mapping, Any, Coroutine
-from dataclasses import asdict
+from __future__ import annotations
 
-from httpx import AsyncClient, Response
+from typing import Optional, Mapping, Any, Awaitable, Iterable, Iterator, AsyncIterable, AsyncIterator, TYPE_CHECKING
+from asyncio import gather, create_task
+from dataclasses import fields
+from itertools import islice
+from json import dumps as json_dumps
 
-from couchdb_api.structures import DesignDocument, SecurityObject
+try:
+    from asyncio import TaskGroup
+except ImportError:
+    TaskGroup = None
+
+try:
+    from orjson import dumps as orjson_dumps, OPT_NON_STR_KEYS, OPT_PASSTHROUGH_DATACLASS, OPT_PASSTHROUGH_DATETIME
+
+    _ORJSON_OPTIONS = OPT_NON_STR_KEYS | OPT_PASSTHROUGH_DATACLASS | OPT_PASSTHROUGH_DATETIME
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson_dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Integers exceeding 64 bits, dataclasses, and datetimes are left to `json`, which either serializes them
+            # or raises the same error as when `orjson` is not installed.
+            return json_dumps(obj).encode()
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json_dumps(obj).encode()
+
+from httpx import Headers
+
+from couchdb_api.utils.status_code_message import raise_from_status_with_status_code_message
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient, Response
+    from httpx._types import HeaderTypes
+
+    from couchdb_api.structures import DesignDocument, SecurityObject
 
 
 JSON = str | int | float | bool | None | Mapping[str, 'JSON'] | list['JSON']
 
+_DB_URL = '/{}'.format
+_DOC_URL = '/{}/{}'.format
+_ATTACHMENT_URL = '/{}/{}/{}'.format
+_FIND_URL = '/{}/_find'.format
+_ALL_DOCS_URL = '/{}/_all_docs'.format
+_BULK_DOCS_URL = '/{}/_bulk_docs'.format
+_DESIGN_DOC_URL = '/{}/_design/{}'.format
+_SECURITY_URL = '/{}/_security'.format
+
+
+def _json_body_kwargs(body: JSON, headers: HeaderTypes | None = None, **client_kwargs: Any) -> dict[str, Any]:
+    """
+    Produce HTTP client arguments for sending a JSON request body.
+
+    The body is serialized with `orjson` if it is installed and with the standard library's `json` otherwise. Bodies
+    consisting of JSON types serialize the same either way, except for NaN and infinite floats, which `orjson`
+    serializes as `null`. `orjson` additionally serializes UUIDs and enums, which `json` rejects.
+
+    :param body: JSON content to be sent as the request body.
+    :param headers: Request headers, in any form accepted by the HTTP client, to be sent in addition to the content
+        type. A content type among them takes precedence.
+    :param client_kwargs: Other arguments passed to the HTTP client.
+    :return: Arguments to be passed to the HTTP client.
+    """
+
+    request_headers = Headers(headers)
+    request_headers.setdefault('Content-Type', 'application/json')
+
+    return dict(content=_dumps(body), headers=request_headers, **client_kwargs)
+
 
 def get_db_doc(
     client: AsyncClient,
@@ -15,7 +77,7 @@ def get_db_doc(
     docid: str,
     params: Optional[dict[str, str]] = None,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Retrieve from the CouchDB database with the name `db` a document having the document ID `docid`.
 
@@ -29,7 +91,7 @@ def get_db_doc(
     :return: The response of the HTTP request.
     """
 
-    return client.get(f'/{db}/{docid}', params=params, **client_kwargs)
+    return client.get(_DOC_URL(db, docid), params=params, **client_kwargs)
 
 
 def head_db_doc(
@@ -37,7 +99,7 @@ def head_db_doc(
     db: str,
     docid: str,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Retrieve from the CouchDB database with the name `db` minimal information about the having the document ID `docid`.
 
@@ -51,7 +113,7 @@ def head_db_doc(
     :return: The response of the HTTP request.
     """
 
-    return client.head(f'/{db}/{docid}', **client_kwargs)
+    return client.head(_DOC_URL(db, docid), **client_kwargs)
 
 
 def put_db_doc(
@@ -63,7 +125,7 @@ def put_db_doc(
     batch: str | None = None,
     new_edits: bool | None = None,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Add a new document to the CouchDB database with the name `db`.
 
@@ -88,7 +150,46 @@ def put_db_doc(
     if new_edits is not None:
         params['new_edits'] = new_edits
 
-    return client.put(url=f'/{db}/{docid}', json=body, params=params, **client_kwargs)
+    return client.put(url=_DOC_URL(db, docid), params=params, **_json_body_kwargs(body=body, **client_kwargs))
+
+
+def put_db_doc_async(
+    client: AsyncClient,
+    db: str,
+    docid: str,
+    body: JSON,
+    rev: str | None = None,
+    new_edits: bool | None = None,
+    **client_kwargs: dict[str, Any]
+) -> Awaitable[Response]:
+    """
+    Add a new document to the CouchDB database with the name `db` in batch mode.
+
+    CouchDB accepts the document with a 202 response before committing it to disk. The document is not guaranteed to
+    be stored, nor to be immediately retrievable, once the response has been received.
+
+    https://docs.couchdb.org/en/stable/api/database/common.html#api-doc-batch-writes
+
+    :param client: An HTTP client with which to perform the request.
+    :param db: The name of the CouchDB database to which to add the document.
+    :param docid: The document ID of the new document.
+    :param body: JSON content corresponding to the new document.
+    :param rev: Document’s revision if updating an existing document.
+    :param new_edits: Whether to prevent insertion of a conflicting document.
+    :param client_kwargs: Arguments passed to the HTTP client.
+    :return: The response of the HTTP request.
+    """
+
+    return put_db_doc(
+        client=client,
+        db=db,
+        docid=docid,
+        body=body,
+        rev=rev,
+        batch='ok',
+        new_edits=new_edits,
+        **client_kwargs
+    )
 
 
 def delete_db_doc(
@@ -97,7 +198,7 @@ def delete_db_doc(
     docid: str,
     params: Optional[dict[str, str]] = None,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Mark a document as deleted.
 
@@ -111,7 +212,7 @@ def delete_db_doc(
     :return: The response of the HTTP request.
     """
 
-    return client.delete(url=f'/{db}/{docid}', params=params, **client_kwargs)
+    return client.delete(url=_DOC_URL(db, docid), params=params, **client_kwargs)
 
 
 def db_put(
@@ -119,7 +220,7 @@ def db_put(
     db: str,
     params: Optional[dict[str, str]] = None,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Create a new database.
 
@@ -132,7 +233,7 @@ def db_put(
     :return: The response of the HTTP request.
     """
 
-    return client.put(url=f'/{db}', params=params, **client_kwargs)
+    return client.put(url=_DB_URL(db), params=params, **client_kwargs)
 
 
 def db_post(
@@ -140,7 +241,7 @@ def db_post(
     db: str,
     body: JSON,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Creates a new document in the specified database, using the supplied JSON document structure.
 
@@ -158,7 +259,7 @@ def db_post(
     :return: The response of the HTTP request.
     """
 
-    return client.post(url=f'/{db}', json=body, **client_kwargs)
+    return client.post(url=_DB_URL(db), **_json_body_kwargs(body=body, **client_kwargs))
 
 
 def db_find(
@@ -166,7 +267,7 @@ def db_find(
     db: str,
     body: JSON,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Find documents from the CouchDB database with the name `db` matching a provided specification.
 
@@ -179,7 +280,58 @@ def db_find(
     :return: The response of the HTTP request.
     """
 
-    return client.post(url=f'/{db}/_find', json=body, **client_kwargs)
+    return client.post(url=_FIND_URL(db), **_json_body_kwargs(body=body, **client_kwargs))
+
+
+async def db_find_all(
+    client: AsyncClient,
+    db: str,
+    body: Mapping[str, JSON],
+    page_size: int = 200,
+    **client_kwargs: dict[str, Any]
+) -> AsyncIterator[JSON]:
+    """
+    Find all documents from the CouchDB database with the name `db` matching a provided specification.
+
+    The documents are retrieved one page at a time, using the bookmark of each page to request the next one. A `limit`
+    in `body` bounds the total number of documents retrieved; if it is 0 or negative, no request is made.
+
+    https://docs.couchdb.org/en/stable/api/database/find.html#pagination
+
+    :param client: An HTTP client with which to perform the requests.
+    :param db: The name of the CouchDB database in which to find the matching documents.
+    :param body: JSON content corresponding to a specification for what documents to retrieve.
+    :param page_size: The maximum number of documents to retrieve per request.
+    :param client_kwargs: Arguments passed to the HTTP client.
+    :raises ValueError: If `page_size` is less than 1.
+    :return: An asynchronous iterator of the matching documents.
+    """
+
+    if page_size < 1:
+        raise ValueError(f'The page size must be at least 1, not {page_size}.')
+
+    remaining: int | None = body.get('limit')
+    page_body = dict(body)
+
+    while remaining is None or remaining > 0:
+        page_limit = page_size if remaining is None else min(page_size, remaining)
+        page_body['limit'] = page_limit
+
+        response = await db_find(client=client, db=db, body=page_body, **client_kwargs)
+        raise_from_status_with_status_code_message(response=response)
+
+        response_json = response.json()
+        docs = response_json.get('docs', [])
+        for doc in docs:
+            yield doc
+
+        if not (bookmark := response_json.get('bookmark')) or len(docs) < page_limit:
+            return
+
+        if remaining is not None:
+            remaining -= len(docs)
+
+        page_body = {**page_body, 'bookmark': bookmark}
 
 
 def db_all_docs(
@@ -187,7 +339,7 @@ def db_all_docs(
     db: str,
     params: Optional[dict[str, str]] = None,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Bulk retrieve documents from the CouchDB database with the name `db`.
 
@@ -200,7 +352,35 @@ def db_all_docs(
     :return: The response of the HTTP request.
     """
 
-    return client.get(url=f'/{db}/_all_docs', params=params, **client_kwargs)
+    return client.get(url=_ALL_DOCS_URL(db), params=params, **client_kwargs)
+
+
+def db_all_docs_post(
+    client: AsyncClient,
+    db: str,
+    keys: Iterable[str],
+    include_docs: bool = True,
+    **client_kwargs: dict[str, Any]
+) -> Awaitable[Response]:
+    """
+    Bulk retrieve the documents having the document IDs `keys` from the CouchDB database with the name `db`.
+
+    All documents are retrieved in a single request.
+
+    https://docs.couchdb.org/en/stable/api/database/bulk-api.html#post--db-_all_docs
+
+    :param client: An HTTP client with which to perform the request.
+    :param db: The name of the database to retrieve documents from.
+    :param keys: The document IDs of the documents to retrieve.
+    :param include_docs: Whether to include the full content of the documents in the response.
+    :param client_kwargs: Arguments passed to the HTTP client.
+    :return: The response of the HTTP request.
+    """
+
+    return client.post(
+        url=_ALL_DOCS_URL(db),
+        **_json_body_kwargs(body=dict(keys=list(keys), include_docs=include_docs), **client_kwargs)
+    )
 
 
 def db_bulk_docs(
@@ -209,7 +389,7 @@ def db_bulk_docs(
     documents: list[JSON],
     new_edits: bool = True,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Bulk create or update a set of documents to the CouchDB database with the name `db`.
 
@@ -223,14 +403,92 @@ def db_bulk_docs(
     :return: The response of the HTTP request.
     """
 
-    return client.post(url=f'/{db}/_bulk_docs', json=dict(docs=documents, new_edits=new_edits), **client_kwargs)
+    return client.post(
+        url=_BULK_DOCS_URL(db),
+        **_json_body_kwargs(body=dict(docs=documents, new_edits=new_edits), **client_kwargs)
+    )
+
+
+async def db_bulk_docs_chunked(
+    client: AsyncClient,
+    db: str,
+    documents: Iterable[JSON],
+    new_edits: bool = True,
+    chunk_size: int = 500,
+    max_concurrency: int = 4,
+    **client_kwargs: dict[str, Any]
+) -> list[Response]:
+    """
+    Bulk create or update a set of documents to the CouchDB database with the name `db`, in chunks.
+
+    The documents are split into chunks of at most `chunk_size` documents, each of which is sent in a separate
+    `_bulk_docs` request. `max_concurrency` workers each take the next chunk from `documents` once their previous
+    request has completed, so that at most `max_concurrency` chunks are held in memory and in flight at the same time.
+
+    If a request fails, the remaining chunks are not sent and the exception of the failed request is raised. Chunks
+    sent before the failure may have been written.
+
+    https://docs.couchdb.org/en/stable/api/database/bulk-api.html#post--db-_bulk_docs
+
+    :param client: An HTTP client with which to perform the request.
+    :param db: The name of the database which to operate on.
+    :param documents: The documents to be created or updated.
+    :param new_edits: A flag indicating whether not to prevent the database from assigning new revision IDs.
+    :param chunk_size: The maximum number of documents to send in a single request.
+    :param max_concurrency: The maximum number of requests to have in flight at the same time.
+    :param client_kwargs: Arguments passed to the HTTP client.
+    :raises ValueError: If `chunk_size` or `max_concurrency` is less than 1.
+    :return: The responses of the HTTP requests, in the order of the chunks.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f'The chunk size must be at least 1, not {chunk_size}.')
+    if max_concurrency < 1:
+        raise ValueError(f'The maximum concurrency must be at least 1, not {max_concurrency}.')
+
+    documents_iterator = iter(documents)
+    indexed_chunks: Iterator[tuple[int, list[JSON]]] = enumerate(
+        iter(lambda: list(islice(documents_iterator, chunk_size)), [])
+    )
+    responses: dict[int, Response] = dict()
+
+    async def post_chunks() -> None:
+        # Taking the next chunk does not yield to the event loop, so the workers never take the same chunk.
+        for chunk_index, chunk in indexed_chunks:
+            responses[chunk_index] = await db_bulk_docs(
+                client=client,
+                db=db,
+                documents=chunk,
+                new_edits=new_edits,
+                **client_kwargs
+            )
+
+    # In either case, the first failing request cancels the other workers, and its exception is raised as is.
+    if TaskGroup is None:
+        tasks = [create_task(post_chunks()) for _ in range(max_concurrency)]
+        try:
+            await gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+            raise
+    else:
+        try:
+            async with TaskGroup() as task_group:
+                for _ in range(max_concurrency):
+                    task_group.create_task(post_chunks())
+        except ExceptionGroup as exception_group:
+            raise exception_group.exceptions[0] from None
+
+    return [responses[chunk_index] for chunk_index in range(len(responses))]
 
 
 def all_dbs(
     client: AsyncClient,
     params: Optional[dict[str, str]] = None,
     **client_kwargs: dict[str, Any]
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Return a list of all the databases in the CouchDB instance.
 
@@ -250,7 +508,7 @@ def put_design_doc(
     db: str,
     ddoc: str,
     design_document: DesignDocument
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Create a new named design document, or create a new revision of the existing design document.
 
@@ -264,8 +522,14 @@ def put_design_doc(
     """
 
     return client.put(
-        url=f'/{db}/_design/{ddoc}',
-        json=asdict(design_document, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
+        url=_DESIGN_DOC_URL(db, ddoc),
+        **_json_body_kwargs(
+            body={
+                field.name: value
+                for field in fields(design_document)
+                if (value := getattr(design_document, field.name)) is not None
+            }
+        )
     )
 
 
@@ -273,7 +537,7 @@ def put_db_security(
     client: AsyncClient,
     db: str,
     security_object: SecurityObject
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Set the security object for a given database.
 
@@ -286,61 +550,55 @@ def put_db_security(
     """
 
     return client.put(
-        url=f'/{db}/_security',
-        json=asdict(security_object)
+        url=_SECURITY_URL(db),
+        **_json_body_kwargs(
+            body=dict(
+                members=dict(names=security_object.members.names, roles=security_object.members.roles),
+                admins=dict(names=security_object.admins.names, roles=security_object.admins.roles)
+            )
+        )
     )
 
 
-def get_attachment(
-    client: AsyncClient,
-    db: str,
-    docid: str,
-    attname: str,
-) -> Coroutine[Any, Any, Response]:
-    """
-    Upload the supplied content as an attachment to the specified document.
-
-    https://docs.couchdb.org/en/stable/api/document/attachments.html#put--db-docid-attname
-
-    :param client: An HTTP client with which to perform the request.
-    :param db: The name of the database which to operate on.
-    :param docid: The ID of the document in which the attachment is stored.
-    :param attname: The name of the attachment to be stored.
-    :return: The response of the HTTP request.
-    """
-
-    return client.get(url=f'/{db}/{docid}/{attname}')
-
-
 def put_attachment(
     client: AsyncClient,
     db: str,
     docid: str,
     attname: str,
-    data: bytes,
+    data: bytes | AsyncIterable[bytes],
     rev: str | None = None,
-    content_type: str | None = None
-) -> Coroutine[Any, Any, Response]:
+    content_type: str | None = None,
+    content_length: int | None = None
+) -> Awaitable[Response]:
     """
     Upload the supplied content as an attachment to the specified document.
 
+    If the data is provided as an asynchronous iterable, the attachment is streamed rather than buffered in memory.
+
     https://docs.couchdb.org/en/stable/api/document/attachments.html#put--db-docid-attname
 
     :param client: An HTTP client with which to perform the request.
     :param db: The name of the database which to operate on.
     :param docid: The ID of the document in which to store the attachment.
     :param attname: The name of the attachment to be stored.
-    :param data: The data constituting the attachment.
+    :param data: The data constituting the attachment, either as bytes or as an asynchronous iterable of bytes.
     :param rev: The document revision of a document to be updated.
     :param content_type: The content type of the attachment.
+    :param content_length: The length of streamed data, if known, sparing the use of chunked transfer encoding.
     :return: The response of the HTTP request.
     """
 
+    headers = dict()
+    if content_type:
+        headers['Content-Type'] = content_type
+    if content_length is not None:
+        headers['Content-Length'] = str(content_length)
+
     return client.put(
-        url=f'/{db}/{docid}/{attname}',
-        headers={'Content-Type': content_type} if content_type else None,
+        url=_ATTACHMENT_URL(db, docid, attname),
+        headers=headers or None,
         params=dict(rev=rev) if rev else None,
-        data=data
+        content=data
     )
 
 
@@ -349,7 +607,7 @@ def get_attachment(
     db: str,
     docid: str,
     attname: str,
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Retrieve the file attachment data associated with the specified document.
 
@@ -362,7 +620,7 @@ def get_attachment(
     :return: The response of the HTTP request.
     """
 
-    return client.get(url=f'/{db}/{docid}/{attname}')
+    return client.get(url=_ATTACHMENT_URL(db, docid, attname))
 
 
 def create_user(
@@ -370,7 +628,7 @@ def create_user(
     username: str,
     password: str,
     roles: Optional[list[str]] = None
-) -> Coroutine[Any, Any, Response]:
+) -> Awaitable[Response]:
     """
     Create a new user in CouchDB.
 
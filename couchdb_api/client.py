@@ -0,0 +1,386 @@
+from types import TracebackType
+from collections import OrderedDict
+from typing import Optional, Any, Awaitable, Iterable, AsyncIterable, AsyncIterator, Mapping, Type
+
+from httpx import AsyncClient, Response, Headers, Limits, Auth
+
+from couchdb_api import calls
+from couchdb_api.calls import JSON
+from couchdb_api.structures import DesignDocument, SecurityObject
+
+
+DEFAULT_LIMITS = Limits(max_keepalive_connections=20, max_connections=100)
+
+
+class CouchDBClient:
+    """
+    A CouchDB client that owns a long-lived HTTP client, so that connections are reused across API calls.
+
+    The methods delegate to the functions in `couchdb_api.calls`.
+
+    With HTTP/2 enabled, concurrent requests are multiplexed over a single connection rather than being limited by the
+    size of the connection pool. CouchDB itself only speaks HTTP/1.1, so HTTP/2 is only of use behind a reverse proxy
+    that supports it, and it requires the `http2` extra to be installed.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth: Auth | tuple[str, str] | None = None,
+        limits: Limits = DEFAULT_LIMITS,
+        http1: bool = True,
+        http2: bool = False,
+        etag_cache_size: int = 128,
+        **client_kwargs: dict[str, Any]
+    ):
+        """
+        :param base_url: The base URL of the CouchDB instance.
+        :param auth: Authentication to use when performing requests.
+        :param limits: Limits on the number of connections in the connection pool.
+        :param http1: Whether to enable HTTP/1.1 support.
+        :param http2: Whether to enable HTTP/2 support.
+        :param etag_cache_size: The maximum number of documents to cache for conditional retrieval. 0 disables caching.
+        :param client_kwargs: Arguments passed to the HTTP client.
+        """
+
+        self._client = AsyncClient(
+            base_url=base_url,
+            auth=auth,
+            limits=limits,
+            http1=http1,
+            http2=http2,
+            **client_kwargs
+        )
+
+        self._etag_cache_size = etag_cache_size
+        # Maps a database name and document ID to the ETag, headers, and decoded content of the document's response.
+        self._etag_cache: OrderedDict[tuple[str, str], tuple[str, Headers, bytes]] = OrderedDict()
+
+    @property
+    def client(self) -> AsyncClient:
+        """
+        The HTTP client with which requests are performed.
+        """
+
+        return self._client
+
+    async def close(self) -> None:
+        """
+        Close the HTTP client and its pooled connections.
+        """
+
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'CouchDBClient':
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None
+    ) -> None:
+        await self._client.__aexit__(exc_type, exc_value, traceback)
+
+    async def get_db_doc(
+        self,
+        db: str,
+        docid: str,
+        params: Optional[dict[str, str]] = None,
+        **client_kwargs: dict[str, Any]
+    ) -> Response:
+        """
+        Retrieve from the CouchDB database with the name `db` a document having the document ID `docid`.
+
+        Unlike `couchdb_api.calls.get_db_doc`, a previously retrieved copy of the document is revalidated with its ETag,
+        and returned from the cache if the document has not been modified. Only requests without query parameters or
+        custom headers make use of the cache.
+
+        https://docs.couchdb.org/en/stable/api/document/common.html#get--db-docid
+
+        :param db: The name of the CouchDB database from which to retrieve the document.
+        :param docid: The document ID of the document to retrieve.
+        :param params: Optional query parameter options. Providing any bypasses the cache.
+        :param client_kwargs: Arguments passed to the HTTP client. Providing headers bypasses the cache.
+        :return: The response of the HTTP request, or a response reconstructed from the cache if the document was not
+            modified.
+        """
+
+        if params or 'headers' in client_kwargs or self._etag_cache_size <= 0:
+            return await calls.get_db_doc(self._client, db=db, docid=docid, params=params, **client_kwargs)
+
+        cache_key = (db, docid)
+        if (cache_entry := self._etag_cache.get(cache_key)) is not None:
+            client_kwargs['headers'] = {'If-None-Match': cache_entry[0]}
+
+        response = await calls.get_db_doc(self._client, db=db, docid=docid, **client_kwargs)
+
+        if response.status_code == 304 and cache_entry is not None:
+            self._etag_cache.move_to_end(cache_key)
+            _, headers, content = cache_entry
+
+            cached_response = Response(status_code=200, headers=headers, content=content, request=response.request)
+            try:
+                cached_response.elapsed = response.elapsed
+            except RuntimeError:
+                # The elapsed time is not recorded for responses from some transports, such as mock transports.
+                pass
+            return cached_response
+
+        if response.status_code == 200 and 'ETag' in response.headers:
+            # The content is stored decoded, so headers describing the encoding on the wire no longer apply.
+            headers = response.headers.copy()
+            for header_name in ('Content-Encoding', 'Content-Length', 'Transfer-Encoding'):
+                headers.pop(header_name, None)
+
+            self._etag_cache[cache_key] = (response.headers['ETag'], headers, response.content)
+            self._etag_cache.move_to_end(cache_key)
+            while len(self._etag_cache) > self._etag_cache_size:
+                self._etag_cache.popitem(last=False)
+        else:
+            self._etag_cache.pop(cache_key, None)
+
+        return response
+
+    def head_db_doc(self, db: str, docid: str, **client_kwargs: dict[str, Any]) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.head_db_doc` with the owned HTTP client.
+        """
+
+        return calls.head_db_doc(self._client, db=db, docid=docid, **client_kwargs)
+
+    def put_db_doc(
+        self,
+        db: str,
+        docid: str,
+        body: JSON,
+        rev: str | None = None,
+        batch: str | None = None,
+        new_edits: bool | None = None,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.put_db_doc` with the owned HTTP client.
+        """
+
+        return calls.put_db_doc(
+            self._client,
+            db=db,
+            docid=docid,
+            body=body,
+            rev=rev,
+            batch=batch,
+            new_edits=new_edits,
+            **client_kwargs
+        )
+
+    def put_db_doc_async(
+        self,
+        db: str,
+        docid: str,
+        body: JSON,
+        rev: str | None = None,
+        new_edits: bool | None = None,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.put_db_doc_async` with the owned HTTP client.
+        """
+
+        return calls.put_db_doc_async(
+            self._client,
+            db=db,
+            docid=docid,
+            body=body,
+            rev=rev,
+            new_edits=new_edits,
+            **client_kwargs
+        )
+
+    def delete_db_doc(
+        self,
+        db: str,
+        docid: str,
+        params: Optional[dict[str, str]] = None,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.delete_db_doc` with the owned HTTP client.
+        """
+
+        return calls.delete_db_doc(self._client, db=db, docid=docid, params=params, **client_kwargs)
+
+    def db_put(
+        self,
+        db: str,
+        params: Optional[dict[str, str]] = None,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.db_put` with the owned HTTP client.
+        """
+
+        return calls.db_put(self._client, db=db, params=params, **client_kwargs)
+
+    def db_post(self, db: str, body: JSON, **client_kwargs: dict[str, Any]) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.db_post` with the owned HTTP client.
+        """
+
+        return calls.db_post(self._client, db=db, body=body, **client_kwargs)
+
+    def db_find(self, db: str, body: JSON, **client_kwargs: dict[str, Any]) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.db_find` with the owned HTTP client.
+        """
+
+        return calls.db_find(self._client, db=db, body=body, **client_kwargs)
+
+    def db_find_all(
+        self,
+        db: str,
+        body: Mapping[str, JSON],
+        page_size: int = 200,
+        **client_kwargs: dict[str, Any]
+    ) -> AsyncIterator[JSON]:
+        """
+        Delegate to `couchdb_api.calls.db_find_all` with the owned HTTP client.
+        """
+
+        return calls.db_find_all(self._client, db=db, body=body, page_size=page_size, **client_kwargs)
+
+    def db_all_docs(
+        self,
+        db: str,
+        params: Optional[dict[str, str]] = None,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.db_all_docs` with the owned HTTP client.
+        """
+
+        return calls.db_all_docs(self._client, db=db, params=params, **client_kwargs)
+
+    def db_all_docs_post(
+        self,
+        db: str,
+        keys: Iterable[str],
+        include_docs: bool = True,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.db_all_docs_post` with the owned HTTP client.
+        """
+
+        return calls.db_all_docs_post(self._client, db=db, keys=keys, include_docs=include_docs, **client_kwargs)
+
+    def db_bulk_docs(
+        self,
+        db: str,
+        documents: list[JSON],
+        new_edits: bool = True,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.db_bulk_docs` with the owned HTTP client.
+        """
+
+        return calls.db_bulk_docs(self._client, db=db, documents=documents, new_edits=new_edits, **client_kwargs)
+
+    def db_bulk_docs_chunked(
+        self,
+        db: str,
+        documents: Iterable[JSON],
+        new_edits: bool = True,
+        chunk_size: int = 500,
+        max_concurrency: int = 4,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[list[Response]]:
+        """
+        Delegate to `couchdb_api.calls.db_bulk_docs_chunked` with the owned HTTP client.
+        """
+
+        return calls.db_bulk_docs_chunked(
+            self._client,
+            db=db,
+            documents=documents,
+            new_edits=new_edits,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+            **client_kwargs
+        )
+
+    def all_dbs(
+        self,
+        params: Optional[dict[str, str]] = None,
+        **client_kwargs: dict[str, Any]
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.all_dbs` with the owned HTTP client.
+        """
+
+        return calls.all_dbs(self._client, params=params, **client_kwargs)
+
+    def put_design_doc(
+        self,
+        db: str,
+        ddoc: str,
+        design_document: DesignDocument
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.put_design_doc` with the owned HTTP client.
+        """
+
+        return calls.put_design_doc(self._client, db=db, ddoc=ddoc, design_document=design_document)
+
+    def put_db_security(self, db: str, security_object: SecurityObject) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.put_db_security` with the owned HTTP client.
+        """
+
+        return calls.put_db_security(self._client, db=db, security_object=security_object)
+
+    def get_attachment(self, db: str, docid: str, attname: str) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.get_attachment` with the owned HTTP client.
+        """
+
+        return calls.get_attachment(self._client, db=db, docid=docid, attname=attname)
+
+    def put_attachment(
+        self,
+        db: str,
+        docid: str,
+        attname: str,
+        data: bytes | AsyncIterable[bytes],
+        rev: str | None = None,
+        content_type: str | None = None,
+        content_length: int | None = None
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.put_attachment` with the owned HTTP client.
+        """
+
+        return calls.put_attachment(
+            self._client,
+            db=db,
+            docid=docid,
+            attname=attname,
+            data=data,
+            rev=rev,
+            content_type=content_type,
+            content_length=content_length
+        )
+
+    def create_user(
+        self,
+        username: str,
+        password: str,
+        roles: Optional[list[str]] = None
+    ) -> Awaitable[Response]:
+        """
+        Delegate to `couchdb_api.calls.create_user` with the owned HTTP client.
+        """
+
+        return calls.create_user(self._client, username=username, password=password, roles=roles)
@@ -12,7 +12,7 @@ class ViewOption(TypedDict):
     include_design: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DesignDocument:
     language: Optional[str] = None
     options: Optional[ViewOption] = None
@@ -23,13 +23,13 @@ class DesignDocument:
     autoupdate: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecurityObjectUserList:
     names: list[str] = field(default_factory=list)
     roles: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecurityObject:
     members: SecurityObjectUserList
     admins: SecurityObjectUserList
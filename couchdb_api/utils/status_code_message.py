@@ -1,9 +1,87 @@
+from typing import Final, Callable
+
 from httpx import Request, Response, HTTPStatusError
 
 
+_GET_DB_DOC_MESSAGES: Final[dict[int, str]] = {
+    200: 'Request completed successfully.',
+    304: 'Document wasn’t modified since specified revision.',
+    400: 'The format of the request or revision was invalid.',
+    401: 'Read privilege required.',
+    404: 'Document not found.',
+}
+
+_PUT_DB_DOC_MESSAGES: Final[dict[int, str]] = {
+    201: 'Document created and stored on disk.',
+    202: 'Document data accepted, but not yet stored on disk.',
+    400: 'Invalid request body or parameters.',
+    401: 'Write privileges required.',
+    404: 'Specified database or document ID doesn’t exists.',
+    409: 'Document with the specified ID already exists or specified revision is not latest for target document.',
+}
+
+_DELETE_DB_DOC_MESSAGES: Final[dict[int, str]] = {
+    200: 'Document successfully removed.',
+    202: 'Request was accepted, but changes are not yet stored on disk.',
+    400: 'Invalid request body or parameters.',
+    401: 'Write privileges required.',
+    404: 'Specified database or document ID doesn’t exists.',
+    409: 'Specified revision is not the latest for target document.',
+}
+
+_DB_PUT_MESSAGES: Final[dict[int, str]] = {
+    201: 'Database created successfully (quorum is met).',
+    202: 'Accepted (at least by one node).',
+    400: 'Invalid database name.',
+    401: 'CouchDB Server Administrator privileges required.',
+    412: 'Database already exists.',
+}
+
+_DB_POST_MESSAGES: Final[dict[int, str]] = {
+    201: 'Document created and stored on disk.',
+    202: 'Document data accepted, but not yet stored on disk.',
+    400: 'Invalid database name.',
+    401: 'Write privileges required.',
+    404: 'Database doesn’t exist.',
+    409: 'A Conflicting Document with same ID already exists.',
+}
+
+_DB_FIND_MESSAGES: Final[dict[int, str]] = {
+    200: 'Request completed successfully.',
+    400: 'Invalid request.',
+    401: 'Read permission required.',
+    404: 'Requested database not found.',
+}
+
+_DB_ALL_DOCS_MESSAGES: Final[dict[int, str]] = {
+    200: 'Request completed successfully.',
+    404: 'Requested database not found.',
+}
+
+_DB_ALL_DOCS_POST_MESSAGES: Final[dict[int, str]] = {
+    200: 'Request completed successfully.',
+    400: 'The request provided invalid JSON data.',
+    404: 'Requested database not found.',
+}
+
+_DB_BULK_DOCS_MESSAGES: Final[dict[int, str]] = {
+    201: 'Document(s) have been created or updated.',
+    400: 'The request provided invalid JSON data.',
+    404: 'Requested database not found.',
+}
+
+_ALL_DBS_MESSAGES: Final[dict[int, str]] = {
+    200: 'Request completed successfully.',
+}
+
+_PUT_DB_SECURITY_MESSAGES: Final[dict[int, str]] = {
+    200: 'Request completed successfully.',
+    401: 'CouchDB Server Administrator privileges required.',
+}
+
+
 class CouchDBHTTPStatusError(HTTPStatusError):
-    def __init__(self, message: str, request: Request, response: Response):
-        super().__init__(message=message, request=request, response=response)
+    pass
 
 
 def get_db_doc_status_code_message(status_code: int) -> str | None:
@@ -16,19 +94,7 @@ def get_db_doc_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 200:
-            return 'Request completed successfully.'
-        case 304:
-            return 'Document wasn’t modified since specified revision.'
-        case 400:
-            return 'The format of the request or revision was invalid.'
-        case 401:
-            return 'Read privilege required.'
-        case 404:
-            return 'Document not found.'
-        case _:
-            return None
+    return _GET_DB_DOC_MESSAGES.get(status_code)
 
 
 def put_db_doc_status_code_message(status_code: int) -> str | None:
@@ -41,21 +107,7 @@ def put_db_doc_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 201:
-            return 'Document created and stored on disk.'
-        case 202:
-            return 'Document data accepted, but not yet stored on disk.'
-        case 400:
-            return 'Invalid request body or parameters.'
-        case 401:
-            return 'Write privileges required.'
-        case 404:
-            return 'Specified database or document ID doesn’t exists.'
-        case 409:
-            return 'Document with the specified ID already exists or specified revision is not latest for target document.'
-        case _:
-            return None
+    return _PUT_DB_DOC_MESSAGES.get(status_code)
 
 
 def delete_db_doc_status_code_message(status_code: int) -> str | None:
@@ -68,21 +120,7 @@ def delete_db_doc_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 200:
-            return 'Document successfully removed.'
-        case 202:
-            return 'Request was accepted, but changes are not yet stored on disk.'
-        case 400:
-            return 'Invalid request body or parameters.'
-        case 401:
-            return 'Write privileges required.'
-        case 404:
-            return 'Specified database or document ID doesn’t exists.'
-        case 409:
-            return 'Specified revision is not the latest for target document.'
-        case _:
-            return None
+    return _DELETE_DB_DOC_MESSAGES.get(status_code)
 
 
 def db_put_status_code_message(status_code: int) -> str | None:
@@ -95,19 +133,7 @@ def db_put_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 201:
-            return 'Database created successfully (quorum is met).'
-        case 202:
-            return 'Accepted (at least by one node).'
-        case 400:
-            return 'Invalid database name.'
-        case 401:
-            return 'CouchDB Server Administrator privileges required.'
-        case 412:
-            return 'Database already exists.'
-        case _:
-            return None
+    return _DB_PUT_MESSAGES.get(status_code)
 
 
 def db_post_status_code_message(status_code: int) -> str | None:
@@ -120,21 +146,7 @@ def db_post_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 201:
-            return 'Document created and stored on disk.'
-        case 202:
-            return 'Document data accepted, but not yet stored on disk.'
-        case 400:
-            return 'Invalid database name.'
-        case 401:
-            return 'Write privileges required.'
-        case 404:
-            return 'Database doesn’t exist.'
-        case 409:
-            return 'A Conflicting Document with same ID already exists.'
-        case _:
-            return None
+    return _DB_POST_MESSAGES.get(status_code)
 
 
 def db_find_status_code_message(status_code: int) -> str | None:
@@ -147,17 +159,7 @@ def db_find_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 200:
-            return 'Request completed successfully.'
-        case 400:
-            return 'Invalid request.'
-        case 401:
-            return 'Read permission required.'
-        case 404:
-            return 'Requested database not found.'
-        case _:
-            return None
+    return _DB_FIND_MESSAGES.get(status_code)
 
 
 def db_all_docs_status_code_message(status_code: int) -> str | None:
@@ -170,13 +172,20 @@ def db_all_docs_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 200:
-            return 'Request completed successfully.'
-        case 404:
-            return 'Requested database not found.'
-        case _:
-            return None
+    return _DB_ALL_DOCS_MESSAGES.get(status_code)
+
+
+def db_all_docs_post_status_code_message(status_code: int) -> str | None:
+    """
+    Translate a status code from a `POST /{db}/_all_docs` response to a message.
+
+    https://docs.couchdb.org/en/stable/api/database/bulk-api.html#post--db-_all_docs
+
+    :param status_code: The status code to be translated.
+    :return: The message corresponding to the status code if a translation was found.
+    """
+
+    return _DB_ALL_DOCS_POST_MESSAGES.get(status_code)
 
 
 def db_bulk_docs_status_code_message(status_code: int) -> str | None:
@@ -189,15 +198,7 @@ def db_bulk_docs_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 201:
-            return 'Document(s) have been created or updated.'
-        case 400:
-            return 'The request provided invalid JSON data.'
-        case 404:
-            return 'Requested database not found.'
-        case _:
-            return None
+    return _DB_BULK_DOCS_MESSAGES.get(status_code)
 
 
 def all_dbs_status_code_message(status_code: int) -> str | None:
@@ -210,11 +211,7 @@ def all_dbs_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 200:
-            return 'Request completed successfully.'
-        case _:
-            return None
+    return _ALL_DBS_MESSAGES.get(status_code)
 
 
 def put_design_doc_status_code_message(status_code: int) -> str:
@@ -240,13 +237,45 @@ def put_db_security_status_code_message(status_code: int) -> str | None:
     :return: The message corresponding to the status code if a translation was found.
     """
 
-    match status_code:
-        case 200:
-            return 'Request completed successfully.'
-        case 401:
-            return 'CouchDB Server Administrator privileges required.'
-        case _:
-            return None
+    return _PUT_DB_SECURITY_MESSAGES.get(status_code)
+
+
+def _url_path_parts(request: Request) -> tuple[str, ...]:
+    """
+    Obtain the non-empty parts of a request's URL path.
+
+    The parts are cached on the request, so that inspecting the same response multiple times splits the path once.
+
+    :param request: The request whose URL path to split.
+    :return: The non-empty parts of the request's URL path.
+    """
+
+    if (url_path_parts := getattr(request, '_couchdb_api_url_path_parts', None)) is None:
+        url_path_parts = tuple(part for part in request.url.path.split('/') if part != '')
+        request._couchdb_api_url_path_parts = url_path_parts
+
+    return url_path_parts
+
+
+# Maps a request method, the number of URL path segments, and the path segment identifying the endpoint (`None`
+# for any segment) to the function translating the status codes of responses from that endpoint.
+_DISPATCH: Final[dict[tuple[str, int, str | None], Callable[[int], str | None]]] = {
+    ('GET', 1, '_all_dbs'): all_dbs_status_code_message,
+    ('GET', 2, '_all_docs'): all_dbs_status_code_message,
+    ('GET', 2, None): get_db_doc_status_code_message,
+    ('PUT', 1, None): db_put_status_code_message,
+    ('PUT', 2, '_security'): put_db_security_status_code_message,
+    ('PUT', 2, None): put_db_doc_status_code_message,
+    ('PUT', 3, '_design'): put_design_doc_status_code_message,
+    ('POST', 1, None): db_post_status_code_message,
+    ('POST', 2, '_bulk_docs'): db_bulk_docs_status_code_message,
+    ('POST', 2, '_find'): db_find_status_code_message,
+    ('POST', 2, '_all_docs'): db_all_docs_post_status_code_message,
+    ('DELETE', 2, None): delete_db_doc_status_code_message,
+}
+
+# The path segments identifying specific endpoints; other segments are database names or document IDs.
+_SPECIAL_PATH_PARTS: Final[frozenset[str]] = frozenset(part for (_, _, part) in _DISPATCH if part is not None)
 
 
 def status_code_message_from_response(response: Response) -> str | None:
@@ -259,61 +288,22 @@ def status_code_message_from_response(response: Response) -> str | None:
     :return: The message corresponding to the response's status code.
     """
 
-    url_path_parts: tuple[str, ...] = tuple(part for part in response.request.url.path.split('/') if part != '')
-
-    match response.request.method:
-        case 'GET':
-            if len(url_path_parts) == 1:
-                match url_path_parts[0]:
-                    case '_all_dbs':
-                        return all_dbs_status_code_message(status_code=response.status_code)
-                    case _:
-                        return None
-            elif len(url_path_parts) == 2:
-                match url_path_parts[1]:
-                    case '_all_docs':
-                        return all_dbs_status_code_message(status_code=response.status_code)
-                    case _:
-                        return get_db_doc_status_code_message(status_code=response.status_code)
-            else:
-                return None
-        case 'PUT':
-            if len(url_path_parts) == 1:
-                match url_path_parts[0]:
-                    case _:
-                        return db_put_status_code_message(status_code=response.status_code)
-            elif len(url_path_parts) == 2:
-                match url_path_parts[1]:
-                    case '_security':
-                        return put_db_security_status_code_message(status_code=response.status_code)
-                    case _:
-                        return put_db_doc_status_code_message(status_code=response.status_code)
-            elif len(url_path_parts) == 3:
-                match url_path_parts[1]:
-                    case '_design':
-                        return put_design_doc_status_code_message(status_code=response.status_code)
-                    case _:
-                        return None
-        case 'POST':
-            if len(url_path_parts) == 1:
-                match url_path_parts[0]:
-                    case _:
-                        return db_post_status_code_message(status_code=response.status_code)
-            elif len(url_path_parts) == 2:
-                match url_path_parts[1]:
-                    case '_bulk_docs':
-                        return db_bulk_docs_status_code_message(status_code=response.status_code)
-                    case '_find':
-                        return db_find_status_code_message(status_code=response.status_code)
-                    case _:
-                        return None
-        case 'DELETE':
-            if len(url_path_parts) == 2:
-                match url_path_parts[0]:
-                    case _:
-                        return delete_db_doc_status_code_message(status_code=response.status_code)
-            else:
-                return None
+    url_path_parts: tuple[str, ...] = _url_path_parts(request=response.request)
+
+    num_url_path_parts = len(url_path_parts)
+    if num_url_path_parts == 0:
+        return None
+
+    method: str = response.request.method
+    endpoint_part: str = url_path_parts[0] if num_url_path_parts == 1 else url_path_parts[1]
+
+    status_code_message_function = None
+    if endpoint_part in _SPECIAL_PATH_PARTS:
+        status_code_message_function = _DISPATCH.get((method, num_url_path_parts, endpoint_part))
+    if status_code_message_function is None:
+        status_code_message_function = _DISPATCH.get((method, num_url_path_parts, None))
+
+    return status_code_message_function(response.status_code) if status_code_message_function else None
 
 
 def raise_from_status_with_status_code_message(response: Response) -> None:
@@ -6,5 +6,10 @@ setup(
     packages=find_packages(),
     install_requires=[
         'httpx==0.23.3'
-    ]
+    ],
+    extras_require={
+        # Faster JSON serialization of request bodies; NaN and infinite floats are sent as null.
+        'orjson': ['orjson'],
+        'http2': ['httpx[http2]==0.23.3']
+    }
 )